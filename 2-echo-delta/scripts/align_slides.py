@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+발표 자막(SRT) ↔ 슬라이드(PDF) 정렬 스크립트
+슬라이드별 시작 타임스탬프 맵 생성 (오프라인)
+
+- 슬라이드 텍스트는 PDF 내용 해시 기준으로 한 번만 추출해 캐시
+- 자막을 시간 창으로 훑으면서(슬라이딩 윈도우) 다음 몇 장의 슬라이드와만 비교
+- 입력이 바뀐 발표만 다시 처리, 발표별로 병렬 실행
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 디렉토리 설정
+SCRIPT_DIR = Path(__file__).parent
+BASE_DIR = SCRIPT_DIR.parent  # 2-echo-delta/
+SLIDES_DIR = BASE_DIR / "slides"
+VIDEOS_DIR = BASE_DIR / "videos"
+CACHE_DIR = BASE_DIR / ".cache" / "slide_text"
+OUTPUT_DIR = SLIDES_DIR / "alignment"
+
+# 정렬 파라미터
+WINDOW_SEC = 40.0   # 자막 창 길이
+STEP_SEC = 5.0      # 창 이동 간격
+LOOKAHEAD = 3       # 현재 슬라이드 이후 비교할 슬라이드 수
+MIN_SCORE = 0.08    # 다음 슬라이드로 넘어가기 위한 최소 유사도
+MARGIN = 0.02       # 현재 슬라이드보다 이만큼 더 비슷해야 넘어감
+ALIGN_VERSION = 2   # 파라미터/로직이 바뀌면 올려서 전체 재계산
+
+WORD_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+TIME_RE = re.compile(r"(\d+):(\d+):(\d+)[,.](\d+)")
+
+
+def bigrams(text: str) -> Counter:
+    """단어 내부 글자 bigram 빈도 (형태소 분석 없이 한국어/영어 공통)"""
+    counts = Counter()
+    for word in WORD_RE.findall(text.lower()):
+        counts.update(word[i:i + 2] for i in range(len(word) - 1))
+    return counts
+
+
+def parse_time(value: str) -> float:
+    h, m, s, ms = TIME_RE.match(value.strip()).groups()
+    return int(h) * 3600 + int(m) * 60 + int(s) + int(ms.ljust(3, "0")[:3]) / 1000
+
+
+def format_time(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def load_srt(srt_path: Path) -> list:
+    """SRT 자막을 (시작 초, 텍스트) 목록으로 로드"""
+    cues = []
+    blocks = re.split(r"\n\s*\n", srt_path.read_text(encoding="utf-8-sig").strip())
+    for block in blocks:
+        lines = block.strip().splitlines()
+        for i, line in enumerate(lines):
+            if "-->" in line:
+                start = parse_time(line.split("-->")[0])
+                text = " ".join(lines[i + 1:]).strip()
+                if text:
+                    cues.append((start, text))
+                break
+    cues.sort(key=lambda c: c[0])
+    return cues
+
+
+def fingerprint(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def extract_slide_text(pdf_path: Path) -> list:
+    """슬라이드별 텍스트 (PDF 내용 해시 기준 캐시)"""
+    digest = hashlib.sha1(pdf_path.read_bytes()).hexdigest()
+    cache_path = CACHE_DIR / f"{digest}.json"
+    if cache_path.exists():
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise SystemExit("pypdf가 필요합니다: pip install pypdf")
+
+    reader = PdfReader(str(pdf_path))
+    texts = [page.extract_text() or "" for page in reader.pages]
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(texts, ensure_ascii=False), encoding="utf-8")
+    return texts
+
+
+def slide_vectors(texts: list):
+    """슬라이드별 TF-IDF bigram 벡터와 노름, bigram 가중치(idf)"""
+    counts = [bigrams(t) for t in texts]
+    df = Counter()
+    for c in counts:
+        df.update(c.keys())
+    n = len(counts)
+    idf = {g: math.log((n + 1) / (d + 1)) + 1 for g, d in df.items()}
+
+    vectors, norms = [], []
+    for c in counts:
+        vec = {g: cnt * idf[g] for g, cnt in c.items()}
+        vectors.append(vec)
+        norms.append(math.sqrt(sum(v * v for v in vec.values())))
+    return vectors, norms, idf
+
+
+def slide_entries(starts: list, scores: list) -> list:
+    """슬라이드별 결과 항목 (매칭 안 된 슬라이드는 start/seconds가 None)"""
+    return [{"slide": i + 1,
+             "start": format_time(start) if start is not None else None,
+             "seconds": start,
+             "score": round(score, 3)}
+            for i, (start, score) in enumerate(zip(starts, scores))]
+
+
+def align(cues: list, texts: list) -> list:
+    """자막 창을 앞으로 훑으면서 슬라이드별 시작 시간 결정
+
+    창은 두 포인터로 이동하며 bigram 빈도를 증감만 하고,
+    비교는 현재 슬라이드부터 LOOKAHEAD장까지만 해서 전체 시간은 자막 길이에 선형이다.
+    """
+    vectors, norms, idf = slide_vectors(texts)
+    starts = [None] * len(texts)
+    scores = [0.0] * len(texts)
+    if not cues or not texts:
+        return slide_entries(starts, scores)
+
+    cue_grams = [Counter({g: c for g, c in bigrams(text).items() if g in idf}) for _, text in cues]
+    window = Counter()
+    sumsq = 0.0  # 창 벡터 노름의 제곱 (증분 유지)
+
+    def update(grams: Counter, sign: int):
+        nonlocal sumsq
+        for g, c in grams.items():
+            w = idf[g]
+            old = window[g]
+            new = old + sign * c
+            sumsq += w * w * (new * new - old * old)
+            if new:
+                window[g] = new
+            else:
+                del window[g]
+
+    def cosine(s: int) -> float:
+        if not norms[s] or sumsq <= 0:
+            return 0.0
+        vec = vectors[s]
+        # 창은 빈도로 들고 있으므로 idf를 곱해 tf-idf 내적을 계산 (작은 쪽을 순회)
+        keys = window if len(window) < len(vec) else vec
+        dot = sum(window[g] * idf[g] * vec[g] for g in keys if g in window and g in vec)
+        return dot / (math.sqrt(sumsq) * norms[s])
+
+    current = 0
+    starts[0] = cues[0][0]
+    lo = hi = 0
+    t = cues[0][0]
+    end_time = cues[-1][0]
+    while t <= end_time:
+        # 창 [t, t + WINDOW_SEC) 에 들어오는/나가는 자막 반영
+        while hi < len(cues) and cues[hi][0] < t + WINDOW_SEC:
+            update(cue_grams[hi], +1)
+            hi += 1
+        while lo < hi and cues[lo][0] < t:
+            update(cue_grams[lo], -1)
+            lo += 1
+
+        current_score = cosine(current)
+        scores[current] = max(scores[current], current_score)
+        best, best_score = current, current_score
+        for s in range(current + 1, min(current + 1 + LOOKAHEAD, len(texts))):
+            score = cosine(s)
+            if score > best_score:
+                best, best_score = s, score
+        # 현재 슬라이드가 시작된 창에서 바로 넘어가면 두 슬라이드가 같은 시각이 되므로 다음 창부터 허용
+        if (best != current and t > starts[current]
+                and best_score >= MIN_SCORE and best_score > current_score + MARGIN):
+            current = best
+            starts[current] = t
+            scores[current] = best_score
+        t += STEP_SEC
+
+    return slide_entries(starts, scores)
+
+
+def find_talks() -> list:
+    """슬라이드 PDF와 자막 SRT 짝 찾기 (파일명의 스피커 이름 기준)
+
+    슬라이드: '{순서}-{이름}-{제목}.pdf', 자막: 'meetup_02_{이름 두 글자}님*.srt'
+    """
+    srts = sorted(VIDEOS_DIR.glob("*.srt"))
+    talks = []
+    for pdf_path in sorted(SLIDES_DIR.glob("*.pdf")):
+        parts = pdf_path.stem.split("-", 2)
+        speaker = parts[1] if len(parts) > 2 else ""
+        given_name = speaker[1:]
+        match = next((s for s in srts if given_name and f"{given_name}님" in s.stem), None)
+        if match is None:
+            print(f"  - 자막 없음, 건너뜀: {pdf_path.name}")
+            continue
+        talks.append((pdf_path, match))
+    return talks
+
+
+def process_talk(pdf_path: Path, srt_path: Path, force: bool = False) -> str:
+    """발표 하나 정렬 후 결과 저장 (입력이 그대로면 건너뜀)"""
+    output_path = OUTPUT_DIR / f"{pdf_path.stem}.json"
+    inputs = {
+        "slides": pdf_path.name,
+        "slides_fingerprint": fingerprint(pdf_path),
+        "transcript": srt_path.name,
+        "transcript_fingerprint": fingerprint(srt_path),
+        "version": ALIGN_VERSION,
+    }
+    if output_path.exists() and not force:
+        previous = json.loads(output_path.read_text(encoding="utf-8"))
+        if previous.get("inputs") == inputs:
+            return f"변경 없음: {output_path.name}"
+
+    texts = extract_slide_text(pdf_path)
+    cues = load_srt(srt_path)
+    slides = align(cues, texts)
+    for entry, text in zip(slides, texts):
+        entry["title"] = next((line.strip() for line in text.splitlines() if line.strip()), "")
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    result = {"inputs": inputs, "slides": slides}
+    output_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    found = sum(1 for s in slides if s["start"] is not None)
+    return f"생성됨: {output_path.name} ({found}/{len(slides)}장 매칭)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자막 ↔ 슬라이드 정렬")
+    parser.add_argument("--force", action="store_true", help="변경 여부와 관계없이 다시 정렬")
+    parser.add_argument("--jobs", type=int, default=None, help="병렬 프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs는 1 이상이어야 합니다")
+
+    print(f"슬라이드: {SLIDES_DIR}")
+    print(f"자막: {VIDEOS_DIR}\n")
+    talks = find_talks()
+    print(f"\n총 {len(talks)}개 발표 정렬")
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(process_talk, pdf, srt, args.force) for pdf, srt in talks]
+        for future in futures:
+            print(f"  - {future.result()}")
+
+    print(f"\n저장 위치: {OUTPUT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Skillthon 랜덤 팀 / 좌석 배정 스크립트
+
+attendee/attendees.csv를 읽어 (민감 정보라 git 제외, 형식은 attendees.sample.csv 참고)
+- 미리 구성된 팀은 그대로 유지 (명패 열이 있으면 테이블 명패에 그 이름 사용)
+- 팀이 없는 참가자는 '랜덤 N조'로 배정 (팀 크기, 소속 다양성 고려)
+- 스피커/호스트는 Speaker Seats 테이블로 배정
+결과를 attendee/assignments.json으로 저장한다.
+generate_nametags.py(이름표)와 speakers/create_seats_pdf.py(명패)가 이 파일을 그대로 읽는다.
+
+배정은 소속별 라운드로빈 분배(그리디) 후 맞교환 로컬 서치로 같은 소속 쌍을 줄인다.
+"""
+
+import argparse
+import csv
+import json
+import math
+import random
+import re
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+# 디렉토리 설정
+SCRIPT_DIR = Path(__file__).parent
+BASE_DIR = SCRIPT_DIR.parent  # 3-skillthon/
+ATTENDEE_DIR = BASE_DIR / "attendee"
+ATTENDEES_PATH = ATTENDEE_DIR / "attendees.csv"
+SAMPLE_PATH = ATTENDEE_DIR / "attendees.sample.csv"
+ASSIGNMENTS_PATH = ATTENDEE_DIR / "assignments.json"
+
+# 종류(CSV) → 이름표 역할
+ROLES = {"호스트": "Host", "스피커": "Speaker"}
+# 역할별 지정 테이블
+RESERVED_TABLES = {"Host": "Speaker Seats", "Speaker": "Speaker Seats"}
+# 랜덤 팀 이름
+RANDOM_TEAM_NAME = "랜덤 {}조"
+RANDOM_TEAM_RE = re.compile(r"랜덤 (\d+)조")
+
+
+def load_attendees(csv_path: Path) -> list:
+    """CSV에서 참석자 목록 로드 (이름, 소속, 팀, 종류, 명패)"""
+    attendees = []
+    with open(csv_path, 'r', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            name = row.get('이름', '').strip()
+            if not name:
+                continue
+            attendees.append({
+                "name": name,
+                "org": row.get('소속', '').strip(),
+                "team": row.get('팀', '').strip(),
+                "role": ROLES.get(row.get('종류', '').strip(), ""),
+                "tent": (row.get('명패') or '').strip(),
+            })
+    return attendees
+
+
+def team_sizes(count: int, min_size: int, max_size: int) -> list:
+    """count명을 min_size~max_size 크기 팀으로 최대한 고르게 나눈 크기 목록
+
+    max_size는 항상 지킨다. 최대 인원을 지키는 가장 적은 팀 수로 나눠도
+    min_size를 못 채우면 (범위 안에서 나눌 방법이 없으면) 경고만 출력한다.
+    """
+    if not 1 <= min_size <= max_size:
+        raise ValueError(f"팀 인원 범위가 잘못됨: {min_size}~{max_size}")
+    if count == 0:
+        return []
+    num_teams = math.ceil(count / max_size)
+    base, extra = divmod(count, num_teams)
+    sizes = [base + 1 if i < extra else base for i in range(num_teams)]
+    if base < min_size:
+        print(f"  ! 랜덤 팀: {count}명을 {min_size}~{max_size}명 팀으로 나눌 수 없음 "
+              f"({'/'.join(map(str, sizes))}명으로 배정)")
+    return sizes
+
+
+def same_org_pairs(counts: Counter) -> int:
+    """한 팀 안의 같은 소속 쌍 수 (소속 미입력은 제외)"""
+    return sum(c * (c - 1) // 2 for org, c in counts.items() if org)
+
+
+def deal_random_teams(people: list, sizes: list, rng: random.Random) -> list:
+    """소속이 많은 순서로 묶어 팀에 돌아가며 나눠 주기 (같은 소속을 최대한 분산)"""
+    by_org = defaultdict(list)
+    for p in people:
+        by_org[p["org"]].append(p)
+    groups = list(by_org.values())
+    for group in groups:
+        rng.shuffle(group)
+    rng.shuffle(groups)
+    groups.sort(key=len, reverse=True)
+    ordered = [p for group in groups for p in group]
+
+    # 남은 자리가 있는 팀만 순환 (크기 차이는 최대 1이라 자리 순서대로 돌면 된다)
+    slots = [t for round_ in range(max(sizes, default=0))
+             for t in range(len(sizes)) if round_ < sizes[t]]
+    teams = [[] for _ in sizes]
+    for p, t in zip(ordered, slots):
+        teams[t].append(p)
+    return teams
+
+
+def improve(teams: list, rng: random.Random, max_iters: int, time_limit: float) -> int:
+    """같은 소속이 겹친 사람을 다른 팀과 맞교환해 겹침을 줄이는 로컬 서치
+
+    팀별 소속 카운터로 교환 효과를 O(1)에 계산한다. 남은 겹침 쌍 수를 반환.
+    """
+    counts = [Counter(p["org"] for p in team) for team in teams]
+    cost = sum(same_org_pairs(c) for c in counts)
+    if cost == 0 or len(teams) < 2:
+        return cost
+
+    deadline = time.perf_counter() + time_limit
+    for i in range(max_iters):
+        if cost == 0 or (i % 256 == 0 and time.perf_counter() > deadline):
+            break
+        # 겹침이 있는 팀에서 겹친 사람 하나를 고른다
+        a = rng.randrange(len(teams))
+        if same_org_pairs(counts[a]) == 0:
+            continue
+        xi = rng.randrange(len(teams[a]))
+        x = teams[a][xi]["org"]
+        if not x or counts[a][x] < 2:
+            continue
+        b = rng.randrange(len(teams))
+        if b == a:
+            continue
+        yi = rng.randrange(len(teams[b]))
+        y = teams[b][yi]["org"]
+        if x == y:
+            continue
+
+        # a: x 빠지고 y 들어옴 / b: y 빠지고 x 들어옴
+        delta = -(counts[a][x] - 1) - ((counts[b][y] - 1) if y else 0)
+        delta += (counts[a][y] if y else 0) + counts[b][x]
+        if delta < 0:
+            teams[a][xi], teams[b][yi] = teams[b][yi], teams[a][xi]
+            counts[a][x] -= 1
+            counts[b][x] += 1
+            if y:
+                counts[a][y] += 1
+                counts[b][y] -= 1
+            cost += delta
+    return cost
+
+
+def assign(attendees: list, min_size: int = 2, max_size: int = 4, seed: int = None,
+           max_iters: int = 200_000, time_limit: float = 0.5) -> dict:
+    """팀/테이블 배정 결과 생성"""
+    rng = random.Random(seed)
+    staff = [p for p in attendees if p["role"]]
+    guests = [p for p in attendees if not p["role"]]
+
+    # 미리 구성된 팀은 그대로 (CSV 순서 유지)
+    preformed = defaultdict(list)
+    for p in guests:
+        if p["team"]:
+            preformed[p["team"]].append(p)
+    for team, members in preformed.items():
+        if len(members) > max_size:
+            print(f"  ! {team}: {len(members)}명 (최대 {max_size}명 초과, 그대로 유지)")
+
+    solo = [p for p in guests if not p["team"]]
+    random_teams = deal_random_teams(solo, team_sizes(len(solo), min_size, max_size), rng)
+    cost = improve(random_teams, rng, max_iters, time_limit)
+
+    # CSV에 이미 '랜덤 N조' 팀이 있으면 그 다음 번호부터 붙여 이름이 겹치지 않게 한다
+    taken = [int(m.group(1)) for name in preformed if (m := RANDOM_TEAM_RE.fullmatch(name))]
+    offset = max(taken, default=0)
+    if taken:
+        print(f"  ! CSV에 랜덤 팀 이름이 이미 있음: 새 랜덤 팀은 {offset + 1}조부터 번호 부여")
+
+    # 명패 이름은 팀원 중 처음 적힌 값 (없으면 팀명 그대로)
+    teams = [{"name": name, "random": False, "members": members,
+              "table": next((p["tent"] for p in members if p["tent"]), name)}
+             for name, members in preformed.items()]
+    for i, members in enumerate(random_teams, offset + 1):
+        name = RANDOM_TEAM_NAME.format(i)
+        teams.append({"name": name, "table": name, "random": True, "members": members})
+
+    participants = [{"name": p["name"], "team": team["name"], "role": "", "table": team["table"]}
+                    for team in teams for p in team["members"]]
+    # 스피커/호스트 이름표에는 소속 표시 (Host 먼저, 기존 이름표 순서와 동일)
+    for role in ("Host", "Speaker"):
+        participants += [{"name": p["name"], "team": p["org"], "role": role,
+                          "table": RESERVED_TABLES[role]}
+                         for p in staff if p["role"] == role]
+
+    return {
+        "seed": seed,
+        "same_org_pairs": cost,
+        "teams": [{"name": t["name"], "table": t["table"], "random": t["random"],
+                   "members": [p["name"] for p in t["members"]]} for t in teams],
+        "tables": [t["table"] for t in teams],
+        "reserved_tables": sorted(set(RESERVED_TABLES.values())),
+        "participants": participants,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skillthon 랜덤 팀 / 좌석 배정")
+    parser.add_argument("--csv", type=Path, default=ATTENDEES_PATH, help="참석자 CSV")
+    parser.add_argument("--min-size", type=int, default=2, help="랜덤 팀 최소 인원 (기본 2)")
+    parser.add_argument("--max-size", type=int, default=4, help="랜덤 팀 최대 인원 (기본 4)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (같은 시드면 같은 배정)")
+    args = parser.parse_args()
+    if args.min_size < 1 or args.max_size < 1:
+        parser.error("--min-size, --max-size는 1 이상이어야 합니다")
+    if args.min_size > args.max_size:
+        parser.error("--min-size가 --max-size보다 클 수 없습니다")
+
+    if not args.csv.exists():
+        print(f"{args.csv}가 없습니다. {SAMPLE_PATH.name} 형식으로 참석자 CSV를 준비하세요.")
+        print(f"  예: python {Path(__file__).name} --csv {SAMPLE_PATH}")
+        return
+
+    print(f"CSV 파일 로드: {args.csv}")
+    attendees = load_attendees(args.csv)
+    print(f"총 {len(attendees)}명의 참석자 발견\n")
+
+    start = time.perf_counter()
+    result = assign(attendees, args.min_size, args.max_size, args.seed)
+    elapsed = time.perf_counter() - start
+
+    for team in result["teams"]:
+        tag = "랜덤" if team["random"] else "기존"
+        print(f"  [{tag}] {team['name']} ({len(team['members'])}명): {', '.join(team['members'])}")
+    print(f"\n팀 {len(result['teams'])}개, 같은 소속 겹침 {result['same_org_pairs']}쌍 ({elapsed * 1000:.0f}ms)")
+
+    ASSIGNMENTS_PATH.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"저장 위치: {ASSIGNMENTS_PATH}")
+    print("다음 단계: scripts/generate_nametags.py, speakers/create_seats_pdf.py")
+
+
+if __name__ == "__main__":
+    main()
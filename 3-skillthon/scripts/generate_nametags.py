@@ -4,6 +4,10 @@ Skillthon 이름표 생성 스크립트
 Echo & Delta와 동일한 사이즈/형식, Anthropic 후원
 """
 
+import argparse
+import hashlib
+import io
+import json
 import os
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
@@ -32,6 +36,22 @@ MEDIUM_TEXT = (100, 100, 100)
 LIGHT_TEXT = (150, 150, 150)
 GRAY = (209, 213, 220)
 
+# 참가자별 텍스트 폰트 크기 (글리프 아틀라스도 같은 값 사용)
+NAME_FONT_SIZE = 56
+TEAM_FONT_SIZE = 32
+ROLE_FONT_SIZE = 24
+
+# 텍스트가 들어가야 하는 영역 (밑줄 좌우 끝 / 흰색 박스 위쪽)
+TEXT_AREA = (96, 558, 622, HEIGHT)
+
+# 미리보기 썸네일 축소 배율 (Image.reduce)
+THUMB_REDUCE = 4
+THUMB_DIR = OUTPUT_DIR / "thumbs"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+
+# 팀 배정 결과 (assign_teams.py)
+ASSIGNMENTS_PATH = BASE_DIR / "attendee" / "assignments.json"
+
 
 def get_font(size: int, bold: bool = False):
     """시스템 폰트 로드"""
@@ -61,9 +81,62 @@ def draw_rounded_rectangle(draw, xy, radius, fill):
     draw.pieslice([x2 - 2*radius, y2 - 2*radius, x2, y2], 0, 90, fill=fill)
 
 
-def create_nametag(name: str, team: str, role: str, index: int,
-                   qr_img: Image.Image, anthropic_img: Image.Image):
-    """이름표 이미지 생성 - Echo & Delta 레이아웃 기반"""
+def text_bbox(draw, text: str, font, atlas=None):
+    """텍스트 bbox - 글리프 아틀라스가 있으면 아틀라스로 계산"""
+    if atlas is not None:
+        return atlas.textbbox((0, 0), text)
+    return draw.textbbox((0, 0), text, font=font)
+
+
+def draw_text(img, draw, xy, text: str, font, fill, atlas=None):
+    """텍스트 그리기 - 글리프 아틀라스가 있으면 마스크 합성으로 찍기"""
+    if atlas is not None:
+        atlas.draw_text(img, xy, text, fill)
+    else:
+        draw.text(xy, text, font=font, fill=fill)
+
+
+def build_glyph_atlases(participants: list) -> dict:
+    """참가자 이름/팀/역할에 쓰인 글리프를 크기별로 미리 래스터화"""
+    from glyph_atlas import GlyphAtlas  # numpy 필요 (--glyph-atlas 사용 시에만)
+
+    names = "".join(p["name"] for p in participants)
+    teams = "".join(p["team"] for p in participants)
+    roles = "".join(f"[ {p['role']} ]" for p in participants if p["role"])
+    return {
+        "name": GlyphAtlas(get_font(NAME_FONT_SIZE), names),
+        "team": GlyphAtlas(get_font(TEAM_FONT_SIZE), teams),
+        "role": GlyphAtlas(get_font(ROLE_FONT_SIZE), roles),
+    }
+
+
+def text_box(xy, bbox) -> list:
+    """원점 기준 bbox를 이름표 좌표로 변환"""
+    x, y = xy
+    return [round(x + bbox[0]), round(y + bbox[1]), round(x + bbox[2]), round(y + bbox[3])]
+
+
+def check_layout(layout: dict) -> list:
+    """텍스트 bbox가 영역을 넘치거나 캔버스 밖으로 잘리는지 검사"""
+    issues = []
+    area_x1, area_y1, area_x2, area_y2 = TEXT_AREA
+    for key, (x1, y1, x2, y2) in layout.items():
+        if x1 < 0 or y1 < 0 or x2 > WIDTH or y2 > HEIGHT:
+            issues.append(f"{key}: 잘림")
+        elif x1 < area_x1 or y1 < area_y1 or x2 > area_x2 or y2 > area_y2:
+            issues.append(f"{key}: 넘침")
+    return issues
+
+
+def render_nametag(name: str, team: str, role: str,
+                   qr_img: Image.Image, anthropic_img: Image.Image,
+                   atlases: dict = None):
+    """이름표 이미지 렌더링 - Echo & Delta 레이아웃 기반
+
+    (이미지, 텍스트 bbox 딕셔너리)를 반환한다.
+    """
+    atlases = atlases or {}
+    layout = {}
     SCALE = 2
 
     # 이미지 생성
@@ -149,49 +222,125 @@ def create_nametag(name: str, team: str, role: str, index: int,
             "Staff": (34, 160, 80),
         }
         role_color = role_colors.get(role, MEDIUM_TEXT)
-        role_font = get_font(24)
+        role_font = get_font(ROLE_FONT_SIZE)
         role_text = f"[ {role} ]"
-        role_bbox = draw.textbbox((0, 0), role_text, font=role_font)
+        role_bbox = text_bbox(draw, role_text, role_font, atlases.get("role"))
         role_width = role_bbox[2] - role_bbox[0]
-        draw.text(((WIDTH - role_width) / 2, 578), role_text, font=role_font, fill=role_color)
+        role_xy = ((WIDTH - role_width) / 2, 578)
+        draw_text(img, draw, role_xy, role_text, role_font, role_color, atlases.get("role"))
+        layout["role"] = text_box(role_xy, role_bbox)
         role_offset = 36
 
     # 이름 텍스트
-    name_font = get_font(56)
-    name_bbox = draw.textbbox((0, 0), name, font=name_font)
+    name_font = get_font(NAME_FONT_SIZE)
+    name_bbox = text_bbox(draw, name, name_font, atlases.get("name"))
     name_width = name_bbox[2] - name_bbox[0]
     name_height = name_bbox[3] - name_bbox[1]
     name_x = (WIDTH - name_width) / 2
     name_underline_y = 558 + 48 + 130 + role_offset
-    draw.text((name_x, name_underline_y - name_height - 20), name, font=name_font, fill=(0, 0, 0))
+    name_xy = (name_x, name_underline_y - name_height - 20)
+    draw_text(img, draw, name_xy, name, name_font, (0, 0, 0), atlases.get("name"))
+    layout["name"] = text_box(name_xy, name_bbox)
 
     # 이름 아래 밑줄
     draw.line([96, name_underline_y, 622, name_underline_y], fill=GRAY, width=4)
 
     # 팀명
-    org_font = get_font(32)
+    org_font = get_font(TEAM_FONT_SIZE)
     org_underline_y = name_underline_y + 40 + 76
     if team:
-        org_bbox = draw.textbbox((0, 0), team, font=org_font)
+        org_bbox = text_bbox(draw, team, org_font, atlases.get("team"))
         org_width = org_bbox[2] - org_bbox[0]
         org_height = org_bbox[3] - org_bbox[1]
         org_x = (WIDTH - org_width) / 2
-        draw.text((org_x, org_underline_y - org_height - 16), team, font=org_font, fill=MEDIUM_TEXT)
+        org_xy = (org_x, org_underline_y - org_height - 16)
+        draw_text(img, draw, org_xy, team, org_font, MEDIUM_TEXT, atlases.get("team"))
+        layout["team"] = text_box(org_xy, org_bbox)
 
     # 팀명 아래 밑줄
     draw.line([96, org_underline_y, 622, org_underline_y], fill=GRAY, width=4)
 
-    # 파일 저장
+    return img, layout
+
+
+def nametag_filename(name: str, index: int) -> str:
+    """이름표 PNG 파일명"""
     safe_name = name.replace(' ', '_').replace('/', '_').replace('(', '').replace(')', '')
-    filename = f"{index:02d}_{safe_name}.png"
+    return f"{index:02d}_{safe_name}.png"
+
+
+def encode_png(img: Image.Image) -> bytes:
+    """PNG 인코딩"""
+    buf = io.BytesIO()
+    img.save(buf, "PNG", quality=95)
+    return buf.getvalue()
+
+
+def encode_thumbnail(img: Image.Image) -> bytes:
+    """렌더 결과에서 바로 만든 미리보기 썸네일 (박스 필터 축소)"""
+    buf = io.BytesIO()
+    img.reduce(THUMB_REDUCE).save(buf, "PNG", compress_level=1)
+    return buf.getvalue()
+
+
+def write_nametag(filename: str, data: bytes, thumb: bytes):
+    """이름표 PNG와 썸네일 저장"""
     filepath = OUTPUT_DIR / filename
-    img.save(filepath, "PNG", quality=95)
+    filepath.write_bytes(data)
+    THUMB_DIR.mkdir(exist_ok=True)
+    (THUMB_DIR / filename).write_bytes(thumb)
     print(f"생성됨: {filename}")
     return filepath
 
 
+def manifest_entry(index: int, p: dict, filename: str, data: bytes, layout: dict) -> dict:
+    """미리보기용 이름표 정보 (파일, 내용 해시, 텍스트 bbox, 넘침 여부)"""
+    return {
+        "index": index,
+        "file": filename,
+        "name": p["name"],
+        "team": p["team"],
+        "role": p["role"],
+        "digest": hashlib.sha1(data).hexdigest(),
+        "layout": layout,
+        "issues": check_layout(layout),
+    }
+
+
+def write_manifest(entries: list):
+    """이름표 목록을 manifest.json으로 저장 (preview_nametags.py 입력)"""
+    entries = sorted(entries, key=lambda e: e["index"])
+    MANIFEST_PATH.write_text(json.dumps(entries, ensure_ascii=False, indent=2), encoding="utf-8")
+    flagged = sum(1 for e in entries if e["issues"])
+    if flagged:
+        print(f"\n텍스트 넘침/잘림 의심: {flagged}개 (preview_nametags.py로 확인)")
+    return MANIFEST_PATH
+
+
+def create_nametag(name: str, team: str, role: str, index: int,
+                   qr_img: Image.Image, anthropic_img: Image.Image,
+                   atlases: dict = None):
+    """이름표 이미지 생성 후 파일 저장
+
+    (파일 경로, manifest 항목)을 반환한다.
+    """
+    img, layout = render_nametag(name, team, role, qr_img, anthropic_img, atlases)
+
+    # 파일 저장
+    filename = nametag_filename(name, index)
+    data = encode_png(img)
+    filepath = write_nametag(filename, data, encode_thumbnail(img))
+    p = {"name": name, "team": team, "role": role}
+    return filepath, manifest_entry(index, p, filename, data, layout)
+
+
 def get_participants():
-    """참가자 목록"""
+    """참가자 목록 - assign_teams.py 배정 결과가 있으면 그대로 사용"""
+    if ASSIGNMENTS_PATH.exists():
+        assignments = json.loads(ASSIGNMENTS_PATH.read_text(encoding="utf-8"))
+        return [{"name": p["name"], "team": p["team"], "role": p["role"]}
+                for p in assignments["participants"]]
+
     teams = [
         {"name": "정승현", "team": "코드스쿼드", "role": ""},
         {"name": "문현경", "team": "코드스쿼드", "role": ""},
@@ -233,39 +382,38 @@ def get_participants():
     return teams + staff
 
 
-def create_pdf(nametag_paths: list):
-    """이름표 4장씩 A4 페이지에 배치한 PDF 생성"""
-    # A4 at 300 DPI
-    A4_W, A4_H = 2480, 3508
-    MARGIN = 40
-    COLS, ROWS = 2, 2
+# A4 at 300 DPI, 2x2 배치
+A4_W, A4_H = 2480, 3508
+PAGE_MARGIN = 40
+PAGE_COLS, PAGE_ROWS = 2, 2
+PER_PAGE = PAGE_COLS * PAGE_ROWS
 
-    cell_w = (A4_W - MARGIN * 3) // COLS
-    cell_h = (A4_H - MARGIN * 3) // ROWS
 
-    pages = []
-    for page_start in range(0, len(nametag_paths), 4):
-        page_imgs = nametag_paths[page_start:page_start + 4]
-        page = Image.new('RGB', (A4_W, A4_H), (255, 255, 255))
+def impose_page(nametags: list) -> Image.Image:
+    """이름표 이미지 최대 4장을 A4 페이지 하나에 배치"""
+    cell_w = (A4_W - PAGE_MARGIN * 3) // PAGE_COLS
+    cell_h = (A4_H - PAGE_MARGIN * 3) // PAGE_ROWS
 
-        for idx, img_path in enumerate(page_imgs):
-            col = idx % COLS
-            row = idx // COLS
+    page = Image.new('RGB', (A4_W, A4_H), (255, 255, 255))
+    for idx, nametag in enumerate(nametags):
+        col = idx % PAGE_COLS
+        row = idx // PAGE_COLS
 
-            nametag = Image.open(img_path)
-            # 셀에 맞게 스케일 (비율 유지)
-            ratio = min(cell_w / nametag.width, cell_h / nametag.height)
-            new_w = int(nametag.width * ratio)
-            new_h = int(nametag.height * ratio)
-            nametag_resized = nametag.resize((new_w, new_h), Image.Resampling.LANCZOS)
+        # 셀에 맞게 스케일 (비율 유지)
+        ratio = min(cell_w / nametag.width, cell_h / nametag.height)
+        new_w = int(nametag.width * ratio)
+        new_h = int(nametag.height * ratio)
+        nametag_resized = nametag.resize((new_w, new_h), Image.Resampling.LANCZOS)
 
-            # 셀 내 중앙 배치
-            x = MARGIN + col * (cell_w + MARGIN) + (cell_w - new_w) // 2
-            y = MARGIN + row * (cell_h + MARGIN) + (cell_h - new_h) // 2
-            page.paste(nametag_resized, (x, y))
+        # 셀 내 중앙 배치
+        x = PAGE_MARGIN + col * (cell_w + PAGE_MARGIN) + (cell_w - new_w) // 2
+        y = PAGE_MARGIN + row * (cell_h + PAGE_MARGIN) + (cell_h - new_h) // 2
+        page.paste(nametag_resized, (x, y))
+    return page
 
-        pages.append(page)
 
+def save_pdf(pages: list):
+    """A4 페이지들을 인쇄용 PDF 하나로 저장"""
     pdf_path = OUTPUT_DIR / "nametags_print.pdf"
     if pages:
         pages[0].save(pdf_path, "PDF", save_all=True, append_images=pages[1:], resolution=300)
@@ -273,7 +421,100 @@ def create_pdf(nametag_paths: list):
     return pdf_path
 
 
+def create_pdf(nametag_paths: list):
+    """이름표 4장씩 A4 페이지에 배치한 PDF 생성"""
+    pages = []
+    for page_start in range(0, len(nametag_paths), PER_PAGE):
+        page_paths = nametag_paths[page_start:page_start + PER_PAGE]
+        pages.append(impose_page([Image.open(path) for path in page_paths]))
+    return save_pdf(pages)
+
+
+class PageImposer:
+    """도착하는 이름표를 번호 순서대로 모아 4장이 차면 A4 페이지로 배치"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.pending = {}   # index -> 이름표 이미지 (순서 밖으로 먼저 도착한 것)
+        self.next_index = 1
+        self.pages = []
+
+    def __call__(self, item):
+        index, img = item
+        self.pending[index] = img
+        while True:
+            page_end = min(self.next_index + PER_PAGE, self.total + 1)
+            if page_end <= self.next_index or any(i not in self.pending for i in range(self.next_index, page_end)):
+                break
+            self.pages.append(impose_page([self.pending.pop(i) for i in range(self.next_index, page_end)]))
+            self.next_index = page_end
+
+
+def run_pipeline(participants: list, qr_img: Image.Image, anthropic_img: Image.Image,
+                 atlases: dict = None, queue_size: int = 8,
+                 encode_workers: int = 2, write_workers: int = 2):
+    """render → encode → write → impose 단계를 겹쳐 실행하고 PDF 저장"""
+    from pipeline import Pipeline, Stage
+
+    entries = {}
+
+    def render(item):
+        index, p = item
+        img, layout = render_nametag(p["name"], p["team"], p["role"], qr_img, anthropic_img, atlases)
+        return index, p, img, layout
+
+    def encode(item):
+        index, p, img, layout = item
+        filename = nametag_filename(p["name"], index)
+        data = encode_png(img)
+        entries[index] = manifest_entry(index, p, filename, data, layout)
+        return index, filename, data, encode_thumbnail(img), img
+
+    def write(item):
+        index, filename, data, thumb, img = item
+        write_nametag(filename, data, thumb)
+        return index, img
+
+    imposer = PageImposer(len(participants))
+    pipeline = Pipeline([
+        Stage("render", render, workers=1, maxsize=queue_size),
+        Stage("encode", encode, workers=encode_workers, maxsize=queue_size),
+        Stage("write", write, workers=write_workers, maxsize=queue_size),
+        Stage("impose", imposer, workers=1, maxsize=queue_size),
+    ])
+    pipeline.run(enumerate(participants, 1))
+
+    print(f"\n완료! {len(participants)}개의 이름표가 생성되었습니다.")
+    print(f"저장 위치: {OUTPUT_DIR}")
+    save_pdf(imposer.pages)
+    write_manifest(list(entries.values()))
+    print(f"\n{pipeline.report()}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Skillthon 이름표 생성")
+    parser.add_argument("--glyph-atlas", action="store_true",
+                        help="이름/팀명을 글리프 아틀라스로 렌더링 (numpy 필요). "
+                             "시작 좌표를 정수 픽셀로 맞추므로 가운데 정렬된 텍스트가 "
+                             "FreeType 경로보다 최대 0.5px 어긋날 수 있음")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="렌더링/인코딩/저장/PDF 배치를 단계별로 겹쳐 실행")
+    parser.add_argument("--queue-size", type=int, default=8,
+                        help="파이프라인 단계 사이 큐 크기 (기본 8)")
+    parser.add_argument("--encode-workers", type=int, default=2,
+                        help="PNG 인코딩 스레드 수 (기본 2)")
+    parser.add_argument("--write-workers", type=int, default=2,
+                        help="파일 저장 스레드 수 (기본 2)")
+    args = parser.parse_args()
+    if args.queue_size < 1:
+        parser.error("--queue-size는 1 이상이어야 합니다")
+    if args.encode_workers < 1 or args.write_workers < 1:
+        parser.error("--encode-workers, --write-workers는 1 이상이어야 합니다")
+    return args
+
+
 def main():
+    args = parse_args()
     participants = get_participants()
     print(f"총 {len(participants)}명의 이름표 생성")
     print(f"저장 위치: {OUTPUT_DIR}\n")
@@ -284,16 +525,32 @@ def main():
     print(f"  - QR 코드: {QR_CODE_PATH}")
     print(f"  - Anthropic 로고: {ANTHROPIC_LOGO_PATH}\n")
 
+    atlases = None
+    if args.glyph_atlas:
+        atlases = build_glyph_atlases(participants)
+        glyph_count = sum(len(a.glyphs) for a in atlases.values())
+        print(f"  - 글리프 아틀라스: {glyph_count}개 글리프 래스터화\n")
+
+    if args.pipeline:
+        run_pipeline(participants, qr_img, anthropic_img, atlases,
+                     queue_size=args.queue_size,
+                     encode_workers=args.encode_workers,
+                     write_workers=args.write_workers)
+        return
+
     nametag_paths = []
+    entries = []
     for i, p in enumerate(participants, 1):
-        path = create_nametag(p["name"], p["team"], p["role"], i, qr_img, anthropic_img)
+        path, entry = create_nametag(p["name"], p["team"], p["role"], i, qr_img, anthropic_img, atlases)
         nametag_paths.append(path)
+        entries.append(entry)
 
     print(f"\n완료! {len(participants)}개의 이름표가 생성되었습니다.")
     print(f"저장 위치: {OUTPUT_DIR}")
 
     # PDF 생성
     create_pdf(nametag_paths)
+    write_manifest(entries)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+글리프 아틀라스 텍스트 렌더러
+
+이름표 한 세트에 쓰이는 글자(한글 음절 포함)는 수백 개 수준이라,
+(폰트, 크기)마다 글리프를 한 번만 래스터화해 두고
+이름/팀명은 NumPy 배열 복사로 조합한다.
+커닝 값은 폰트에서 읽어 글자 쌍마다 캐시한다.
+"""
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+
+class GlyphAtlas:
+    """폰트 하나(크기 고정)의 글리프 마스크 캐시"""
+
+    def __init__(self, font, text: str = ""):
+        self.font = font
+        self.glyphs = {}   # ch -> (마스크 배열, left, top, advance)
+        self.kerning = {}  # (ch1, ch2) -> 커닝 보정값
+        self.add(text)
+
+    def add(self, text: str):
+        """text에 쓰인 글리프를 미리 래스터화"""
+        for ch in set(text):
+            if ch not in self.glyphs:
+                self._rasterize(ch)
+
+    def _rasterize(self, ch: str):
+        """글리프 하나를 안티앨리어싱된 L 마스크로 렌더링"""
+        left, top, right, bottom = self.font.getbbox(ch)
+        if right > left and bottom > top:
+            mask = Image.new('L', (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), ch, font=self.font, fill=255)
+            mask = np.asarray(mask)
+        else:
+            mask = None  # 공백 등 잉크가 없는 글리프
+        self.glyphs[ch] = (mask, left, top, self.font.getlength(ch))
+        return self.glyphs[ch]
+
+    def _kern(self, prev: str, ch: str) -> float:
+        """폰트의 글자 쌍 커닝 (쌍 길이 - 개별 길이 합)"""
+        pair = (prev, ch)
+        if pair not in self.kerning:
+            self.kerning[pair] = (self.font.getlength(prev + ch)
+                                  - self.glyphs[prev][3] - self.glyphs[ch][3])
+        return self.kerning[pair]
+
+    def _layout(self, text: str):
+        """글리프 배치 목록과 원점 기준 bbox 계산"""
+        placed = []
+        pen = 0.0
+        prev = None
+        x0 = y0 = float('inf')
+        x1 = y1 = float('-inf')
+        for ch in text:
+            glyph = self.glyphs.get(ch) or self._rasterize(ch)
+            mask, left, top, advance = glyph
+            if prev is not None:
+                pen += self._kern(prev, ch)
+            if mask is not None:
+                gx, gy = round(pen) + left, top
+                placed.append((gx, gy, mask))
+                x0, y0 = min(x0, gx), min(y0, gy)
+                x1, y1 = max(x1, gx + mask.shape[1]), max(y1, gy + mask.shape[0])
+            pen += advance
+            prev = ch
+        if not placed:
+            return placed, (0, 0, 0, 0)
+        return placed, (x0, y0, x1, y1)
+
+    def textbbox(self, xy, text: str):
+        """ImageDraw.textbbox와 같은 형식의 bbox"""
+        _, (x0, y0, x1, y1) = self._layout(text)
+        x, y = xy
+        return (x + x0, y + y0, x + x1, y + y1)
+
+    def draw_text(self, img: Image.Image, xy, text: str, fill):
+        """글리프 마스크를 합성해 img에 한 번에 찍기 (원점은 정수 픽셀로 스냅)"""
+        placed, (x0, y0, x1, y1) = self._layout(text)
+        if not placed:
+            return
+        canvas = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+        for gx, gy, mask in placed:
+            h, w = mask.shape
+            region = canvas[gy - y0:gy - y0 + h, gx - x0:gx - x0 + w]
+            np.maximum(region, mask, out=region)
+        x, y = xy
+        img.paste(fill, (round(x) + x0, round(y) + y0), Image.fromarray(canvas))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+단계별 생산자/소비자 파이프라인
+
+render → encode → write → impose 처럼 단계를 큐로 이어서 동시에 돌린다.
+- 큐는 크기 제한이 있어 느린 단계가 앞 단계를 막는다 (backpressure)
+- 단계마다 스레드 워커 수를 정할 수 있다 (zlib/파일 I/O는 GIL을 놓음)
+- 단계별 처리 시간, 대기(stall) 시간, 최대 큐 깊이를 기록한다
+"""
+
+import queue
+import threading
+import time
+
+_DONE = object()  # 워커 종료 신호
+
+
+class Stage:
+    """파이프라인 단계 하나 - func(item)의 결과를 다음 단계로 넘긴다"""
+
+    def __init__(self, name: str, func, workers: int = 1, maxsize: int = 8):
+        # 워커가 없으면 다음 단계에 종료 신호를 못 보내 멈추고, 큐 크기 0은 무제한이다
+        if workers < 1:
+            raise ValueError(f"{name}: workers는 1 이상이어야 함 ({workers})")
+        if maxsize < 1:
+            raise ValueError(f"{name}: maxsize는 1 이상이어야 함 ({maxsize})")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.inbox = queue.Queue(maxsize)
+        self.next = None
+
+        # 지표
+        self.items = 0
+        self.busy = 0.0      # func 실행 시간 (워커 합계)
+        self.starved = 0.0   # 입력 큐가 비어 기다린 시간
+        self.blocked = 0.0   # 다음 큐가 가득 차 기다린 시간
+        self.max_depth = 0   # 입력 큐 최대 깊이
+        self.error = None
+        self._lock = threading.Lock()
+        self._remaining = workers
+
+    def put(self, item) -> float:
+        """입력 큐에 넣고 막혀 있던 시간을 반환"""
+        start = time.perf_counter()
+        self.inbox.put(item)
+        waited = time.perf_counter() - start
+        depth = self.inbox.qsize()
+        with self._lock:
+            self.max_depth = max(self.max_depth, depth)
+        return waited
+
+    def close(self):
+        """모든 워커에 종료 신호 보내기"""
+        for _ in range(self.workers):
+            self.inbox.put(_DONE)
+
+    def _work(self):
+        busy = starved = blocked = 0.0
+        items = 0
+        while True:
+            start = time.perf_counter()
+            item = self.inbox.get()
+            starved += time.perf_counter() - start
+            if item is _DONE:
+                break
+            if self.error is not None:
+                continue  # 오류 후에는 앞 단계가 막히지 않도록 비우기만 한다
+
+            start = time.perf_counter()
+            try:
+                result = self.func(item)
+            except Exception as e:
+                self.error = e
+                continue
+            busy += time.perf_counter() - start
+            items += 1
+
+            if self.next is not None:
+                blocked += self.next.put(result)
+
+        with self._lock:
+            self.items += items
+            self.busy += busy
+            self.starved += starved
+            self.blocked += blocked
+            self._remaining -= 1
+            last = self._remaining == 0
+        if last and self.next is not None:
+            self.next.close()
+
+    def start(self) -> list:
+        threads = [threading.Thread(target=self._work, name=f"{self.name}-{i}", daemon=True)
+                   for i in range(self.workers)]
+        for t in threads:
+            t.start()
+        return threads
+
+
+class Pipeline:
+    """Stage 목록을 순서대로 연결해 실행"""
+
+    def __init__(self, stages: list):
+        self.stages = stages
+        for stage, nxt in zip(stages, stages[1:]):
+            stage.next = nxt
+        self.feed_blocked = 0.0
+        self.elapsed = 0.0
+
+    def run(self, items):
+        """items를 첫 단계에 넣고 모든 단계가 끝날 때까지 기다림"""
+        start = time.perf_counter()
+        threads = [t for stage in self.stages for t in stage.start()]
+        first = self.stages[0]
+        for item in items:
+            self.feed_blocked += first.put(item)
+        first.close()
+        for t in threads:
+            t.join()
+        self.elapsed = time.perf_counter() - start
+
+        for stage in self.stages:
+            if stage.error is not None:
+                raise RuntimeError(f"{stage.name} 단계 실패") from stage.error
+
+    def report(self) -> str:
+        """단계별 지표 표"""
+        lines = [f"{'단계':<8} {'워커':>4} {'처리':>6} {'작업(s)':>8} {'입력대기(s)':>10} "
+                 f"{'출력막힘(s)':>10} {'최대큐':>6}"]
+        for s in self.stages:
+            lines.append(f"{s.name:<8} {s.workers:>4} {s.items:>6} {s.busy:>8.2f} "
+                         f"{s.starved:>10.2f} {s.blocked:>10.2f} {s.max_depth:>6}/{s.inbox.maxsize}")
+        lines.append(f"총 소요: {self.elapsed:.2f}s (입력 막힘 {self.feed_blocked:.2f}s)")
+        return "\n".join(lines)
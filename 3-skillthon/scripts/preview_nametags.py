@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Skillthon 이름표 미리보기 (컨택트 시트 + HTML 갤러리)
+
+generate_nametags.py가 남긴 manifest.json과 썸네일로
+- 한 장에 여러 이름표를 모은 컨택트 시트 (페이지 단위)
+- 텍스트 넘침/잘림 의심 이름표를 위에 모은 정적 HTML 갤러리
+를 만든다. 내용이 바뀐 이름표가 포함된 시트만 다시 그린다.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+
+from PIL import Image, ImageDraw
+
+from generate_nametags import (HEIGHT, MANIFEST_PATH, OUTPUT_DIR, THUMB_DIR,
+                               THUMB_REDUCE, WIDTH, get_font)
+
+PREVIEW_DIR = OUTPUT_DIR / "preview"
+SHEET_INDEX_PATH = PREVIEW_DIR / "sheets.json"
+
+# 시트 레이아웃
+SHEET_COLS, SHEET_ROWS = 8, 5
+THUMB_W, THUMB_H = -(-WIDTH // THUMB_REDUCE), -(-HEIGHT // THUMB_REDUCE)  # Image.reduce는 올림
+CAPTION_H = 28
+CELL_PAD = 12
+SHEET_BG = (255, 255, 255)
+FLAG_COLOR = (220, 50, 50)
+CAPTION_COLOR = (60, 60, 60)
+
+
+def load_thumbnail(entry: dict) -> Image.Image:
+    """렌더 단계에서 저장한 썸네일, 없으면 원본을 축소해서 읽기"""
+    thumb_path = THUMB_DIR / entry["file"]
+    if thumb_path.exists():
+        return Image.open(thumb_path).convert('RGB')
+    img = Image.open(OUTPUT_DIR / entry["file"])
+    img.draft('RGB', (THUMB_W, THUMB_H))  # JPEG 등 지원 포맷이면 디코딩 단계에서 축소
+    if img.width >= THUMB_W * 2:
+        img = img.reduce(max(1, img.width // THUMB_W))
+    return img.convert('RGB').resize((THUMB_W, THUMB_H))
+
+
+def sheet_key(entries: list) -> str:
+    """시트 재생성 여부 판단용 키 (이름표 해시 + 레이아웃 설정)"""
+    h = hashlib.sha1(f"{SHEET_COLS}x{SHEET_ROWS}:{THUMB_W}x{THUMB_H}".encode())
+    for e in entries:
+        h.update(f"{e['index']}:{e['digest']}:{','.join(e['issues'])}\n".encode())
+    return h.hexdigest()
+
+
+def render_sheet(entries: list) -> Image.Image:
+    """이름표 썸네일을 격자로 배치한 컨택트 시트"""
+    cell_w = THUMB_W + CELL_PAD * 2
+    cell_h = THUMB_H + CAPTION_H + CELL_PAD * 2
+    sheet = Image.new('RGB', (cell_w * SHEET_COLS, cell_h * SHEET_ROWS), SHEET_BG)
+    draw = ImageDraw.Draw(sheet)
+    caption_font = get_font(16)
+
+    for idx, entry in enumerate(entries):
+        x = (idx % SHEET_COLS) * cell_w + CELL_PAD
+        y = (idx // SHEET_COLS) * cell_h + CELL_PAD
+        sheet.paste(load_thumbnail(entry), (x, y))
+
+        # 넘침/잘림 의심 이름표는 빨간 테두리 + 텍스트 bbox 표시
+        if entry["issues"]:
+            draw.rectangle([x - 4, y - 4, x + THUMB_W + 3, y + THUMB_H + 3], outline=FLAG_COLOR, width=4)
+            for x1, y1, x2, y2 in entry["layout"].values():
+                x1, x2 = (min(max(v // THUMB_REDUCE, 0), THUMB_W - 1) for v in (x1, x2))
+                y1, y2 = (min(max(v // THUMB_REDUCE, 0), THUMB_H - 1) for v in (y1, y2))
+                draw.rectangle([x + x1, y + y1, x + x2, y + y2], outline=FLAG_COLOR)
+
+        caption = f"{entry['index']:02d} {entry['name']}"
+        while len(caption) > 4 and draw.textlength(caption, font=caption_font) > THUMB_W:
+            caption = caption[:-2] + "…"
+        color = FLAG_COLOR if entry["issues"] else CAPTION_COLOR
+        draw.text((x, y + THUMB_H + 6), caption, font=caption_font, fill=color)
+    return sheet
+
+
+def build_sheets(manifest: list, force: bool = False) -> list:
+    """컨택트 시트 생성 - 바뀐 시트만 다시 그린다"""
+    PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
+    previous = {}
+    if SHEET_INDEX_PATH.exists():
+        previous = json.loads(SHEET_INDEX_PATH.read_text(encoding="utf-8"))
+
+    per_sheet = SHEET_COLS * SHEET_ROWS
+    sheets = []
+    rendered = 0
+    for start in range(0, len(manifest), per_sheet):
+        entries = manifest[start:start + per_sheet]
+        filename = f"sheet_{start // per_sheet + 1:03d}.jpg"
+        key = sheet_key(entries)
+        if force or previous.get(filename) != key or not (PREVIEW_DIR / filename).exists():
+            render_sheet(entries).save(PREVIEW_DIR / filename, "JPEG", quality=85)
+            rendered += 1
+        sheets.append({"file": filename, "key": key, "entries": entries})
+
+    # 이름표 수가 줄어 남은 옛 시트 정리 (sheets.json에 없는 파일도 포함)
+    current = {s["file"] for s in sheets}
+    for path in PREVIEW_DIR.glob("sheet_*.jpg"):
+        if path.name not in current:
+            path.unlink()
+
+    SHEET_INDEX_PATH.write_text(json.dumps({s["file"]: s["key"] for s in sheets}, indent=2),
+                                encoding="utf-8")
+    print(f"컨택트 시트: {len(sheets)}장 (다시 그림 {rendered}장)")
+    return sheets
+
+
+def write_gallery(manifest: list, sheets: list):
+    """정적 HTML 갤러리 - 넘침/잘림 의심 목록 + 시트별 이름표 링크"""
+    flagged = [e for e in manifest if e["issues"]]
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="ko"><head><meta charset="utf-8"><title>Skillthon 이름표 미리보기</title>',
+        "<style>body{font-family:sans-serif;margin:24px}img{max-width:100%}"
+        ".flag{color:#dc3232}ul.badges{columns:4}section{margin-bottom:48px}</style>",
+        "</head><body>",
+        f"<h1>Skillthon 이름표 미리보기</h1><p>총 {len(manifest)}개 · 시트 {len(sheets)}장 · "
+        f'<span class="flag">확인 필요 {len(flagged)}개</span></p>',
+    ]
+
+    if flagged:
+        parts.append('<h2 class="flag">텍스트 넘침/잘림 의심</h2><ul>')
+        for e in flagged:
+            parts.append(f'<li><a href="../{html.escape(e["file"])}">{e["index"]:02d} '
+                         f'{html.escape(e["name"])}</a> ({html.escape(e["team"])}) — '
+                         f'{html.escape(", ".join(e["issues"]))}</li>')
+        parts.append("</ul>")
+
+    for page, sheet in enumerate(sheets, 1):
+        parts.append(f'<section id="sheet-{page}"><h2>시트 {page}</h2>')
+        parts.append(f'<img src="{sheet["file"]}" loading="lazy" alt="시트 {page}">')
+        parts.append('<ul class="badges">')
+        for e in sheet["entries"]:
+            cls = ' class="flag"' if e["issues"] else ""
+            parts.append(f'<li{cls}><a href="../{html.escape(e["file"])}">{e["index"]:02d} '
+                         f'{html.escape(e["name"])}</a></li>')
+        parts.append("</ul></section>")
+
+    parts.append("</body></html>")
+    gallery_path = PREVIEW_DIR / "index.html"
+    gallery_path.write_text("\n".join(parts), encoding="utf-8")
+    print(f"갤러리: {gallery_path}")
+    return gallery_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skillthon 이름표 미리보기 생성")
+    parser.add_argument("--force", action="store_true", help="모든 시트를 다시 그림")
+    args = parser.parse_args()
+
+    if not MANIFEST_PATH.exists():
+        print(f"{MANIFEST_PATH}가 없습니다. generate_nametags.py를 먼저 실행하세요.")
+        return
+    manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    print(f"이름표 {len(manifest)}개 로드: {MANIFEST_PATH}")
+
+    sheets = build_sheets(manifest, force=args.force)
+    write_gallery(manifest, sheets)
+
+    for e in manifest:
+        if e["issues"]:
+            print(f"  ! {e['file']}: {', '.join(e['issues'])}")
+
+
+if __name__ == "__main__":
+    main()
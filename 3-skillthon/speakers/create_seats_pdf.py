@@ -8,8 +8,12 @@ A4를 가로로 4등분해서 접어 사용하는 명패 (테이블 텐트)
 생성물:
 1. speaker-seats.pdf - 스피커용 명패
 2. team-seats.pdf - 팀별 명패 (각 팀 이름으로 한 페이지씩)
+
+scripts/assign_teams.py 배정 결과(attendee/assignments.json)가 있으면 그 테이블 목록을 사용한다.
 """
 
+import json
+
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
@@ -27,6 +31,7 @@ SECTION_HEIGHT = HEIGHT / 4
 
 # 출력 경로
 OUTPUT_DIR = Path(__file__).parent
+ASSIGNMENTS_PATH = OUTPUT_DIR.parent / "attendee" / "assignments.json"
 
 # 팀 목록
 TEAMS = [
@@ -39,6 +44,8 @@ TEAMS = [
     "랜덤 2조",
     "랜덤 3조",
 ]
+if ASSIGNMENTS_PATH.exists():
+    TEAMS = json.loads(ASSIGNMENTS_PATH.read_text(encoding="utf-8"))["tables"]
 
 
 def draw_page(c, text, font_name="Helvetica-Bold", font_size=48):